@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from collections.abc import Callable
 import functools
-from itertools import chain
 import logging
-import re
+import string
+import sys
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -23,7 +24,7 @@ from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
-from homeassistant.util.signal_type import SignalTypeFormat
+from homeassistant.util.signal_type import SignalType, SignalTypeFormat
 
 from .abbreviations import ABBREVIATIONS, DEVICE_ABBREVIATIONS, ORIGIN_ABBREVIATIONS
 from .client import async_subscribe_internal
@@ -37,20 +38,14 @@ from .const import (
     DOMAIN,
     SUPPORTED_COMPONENTS,
 )
-from .models import DATA_MQTT, MqttOriginInfo, ReceiveMessage
+from .models import DATA_MQTT, MqttOriginInfo, PendingDiscovered, ReceiveMessage
 from .schemas import MQTT_ORIGIN_INFO_SCHEMA
 from .util import async_forward_entry_setup_and_setup_discovery
 
-ABBREVIATIONS_SET = set(ABBREVIATIONS)
-DEVICE_ABBREVIATIONS_SET = set(DEVICE_ABBREVIATIONS)
-ORIGIN_ABBREVIATIONS_SET = set(ORIGIN_ABBREVIATIONS)
-
 _LOGGER = logging.getLogger(__name__)
 
-TOPIC_MATCHER = re.compile(
-    r"(?P<component>\w+)/(?:(?P<node_id>[a-zA-Z0-9_-]+)/)"
-    r"?(?P<object_id>[a-zA-Z0-9_-]+)/config"
-)
+VALID_COMPONENT_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+VALID_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
@@ -62,15 +57,60 @@ MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
     "mqtt_discovery_done_{}_{}"
 )
 
+DISCOVERY_NEW_SIGNALS: dict[str, SignalType[MQTTDiscoveryPayload]] = {
+    component: MQTT_DISCOVERY_NEW.format(component, "mqtt")
+    for component in SUPPORTED_COMPONENTS
+}
+
 TOPIC_BASE = "~"
+TOPIC_KEYS = tuple(key for key in ABBREVIATIONS.values() if key.endswith("topic"))
 
 
 class MQTTDiscoveryPayload(dict[str, Any]):
     """Class to hold and MQTT discovery payload and discovery data."""
 
+    # Avoid a per instance __dict__, a payload is created for every message
+    __slots__ = ("__configuration_source__", "discovery_data")
+
     discovery_data: DiscoveryInfoType
 
 
+@functools.lru_cache(maxsize=4096)
+def _discovery_updated_signal(
+    discovery_hash: tuple[str, str],
+) -> SignalType[MQTTDiscoveryPayload]:
+    """Return the discovery updated signal for a discovery hash."""
+    return MQTT_DISCOVERY_UPDATED.format(*discovery_hash)
+
+
+@functools.lru_cache(maxsize=4096)
+def _discovery_done_signal(discovery_hash: tuple[str, str]) -> SignalType[Any]:
+    """Return the discovery done signal for a discovery hash."""
+    return MQTT_DISCOVERY_DONE.format(*discovery_hash)
+
+
+def _parse_topic(topic_trimmed: str) -> tuple[str, str | None, str] | None:
+    """Parse a <component>/[<node_id>/]<object_id>/config discovery topic.
+
+    Returns the component, node_id and object_id, or None if the topic is invalid.
+    Splitting the topic is a lot faster than matching a regex for these short
+    topics.
+    """
+    topic_parts = topic_trimmed.split("/")
+    if (num_parts := len(topic_parts)) != 3 and num_parts != 4:
+        return None
+    if topic_parts[-1] != "config":
+        return None
+    component = topic_parts[0]
+    if not component or not VALID_COMPONENT_CHARS.issuperset(component):
+        return None
+    for part in topic_parts[1:-1]:
+        if not part or not VALID_ID_CHARS.issuperset(part):
+            return None
+    node_id = topic_parts[1] if num_parts == 4 else None
+    return component, node_id, topic_parts[-2]
+
+
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
     hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
@@ -83,12 +123,18 @@ def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) ->
 
 @callback
 def async_log_discovery_origin_info(
-    message: str, discovery_payload: MQTTDiscoveryPayload, level: int = logging.INFO
+    message_factory: Callable[[], str],
+    discovery_payload: MQTTDiscoveryPayload,
+    level: int = logging.INFO,
 ) -> None:
-    """Log information about the discovery and origin."""
+    """Log information about the discovery and origin.
+
+    The message is only built when logging is enabled for the level.
+    """
     if not _LOGGER.isEnabledFor(level):
         # bail early if logging is disabled
         return
+    message = message_factory()
     if CONF_ORIGIN not in discovery_payload:
         _LOGGER.log(level, message)
         return
@@ -109,56 +155,78 @@ def async_log_discovery_origin_info(
     )
 
 
-@callback
-def _replace_abbreviations(
-    payload: Any | dict[str, Any],
+def _abbreviations_replacer(
     abbreviations: dict[str, str],
-    abbreviations_set: set[str],
-) -> None:
-    """Replace abbreviations in an MQTT discovery payload."""
-    if not isinstance(payload, dict):
-        return
-    for key in abbreviations_set.intersection(payload):
-        payload[abbreviations[key]] = payload.pop(key)
+) -> Callable[[Any | dict[str, Any]], None]:
+    """Return a function replacing the given abbreviations in a payload."""
+    get_full_key = abbreviations.get
 
+    @callback
+    def _replace_abbreviations(payload: Any | dict[str, Any]) -> None:
+        """Replace abbreviations in an MQTT discovery payload."""
+        if not isinstance(payload, dict):
+            return
+        pop = payload.pop
+        for key in tuple(payload):
+            if (full_key := get_full_key(key)) is not None:
+                payload[full_key] = pop(key)
 
-@callback
-def _replace_all_abbreviations(discovery_payload: Any | dict[str, Any]) -> None:
-    """Replace all abbreviations in an MQTT discovery payload."""
+    return _replace_abbreviations
 
-    _replace_abbreviations(discovery_payload, ABBREVIATIONS, ABBREVIATIONS_SET)
 
-    if CONF_ORIGIN in discovery_payload:
-        _replace_abbreviations(
-            discovery_payload[CONF_ORIGIN],
-            ORIGIN_ABBREVIATIONS,
-            ORIGIN_ABBREVIATIONS_SET,
-        )
+_replace_abbr_root = _abbreviations_replacer(ABBREVIATIONS)
+_replace_abbr_origin = _abbreviations_replacer(ORIGIN_ABBREVIATIONS)
+_replace_abbr_device = _abbreviations_replacer(DEVICE_ABBREVIATIONS)
 
-    if CONF_DEVICE in discovery_payload:
-        _replace_abbreviations(
-            discovery_payload[CONF_DEVICE],
-            DEVICE_ABBREVIATIONS,
-            DEVICE_ABBREVIATIONS_SET,
-        )
 
-    if CONF_AVAILABILITY in discovery_payload:
-        for availability_conf in cv.ensure_list(discovery_payload[CONF_AVAILABILITY]):
-            _replace_abbreviations(availability_conf, ABBREVIATIONS, ABBREVIATIONS_SET)
+@callback
+def _replace_all_abbreviations(discovery_payload: Any | dict[str, Any]) -> None:
+    """Replace all abbreviations in an MQTT discovery payload.
+
+    The root keys are replaced in a single pass over the payload, nested origin,
+    device and availability configs are expanded when their key is visited.
+    """
+    if not isinstance(discovery_payload, dict):
+        return
+    get_full_key = ABBREVIATIONS.get
+    pop = discovery_payload.pop
+    for key in tuple(discovery_payload):
+        if (full_key := get_full_key(key)) is not None:
+            value = discovery_payload[full_key] = pop(key)
+        else:
+            full_key = key
+            value = discovery_payload[key]
+        if full_key == CONF_ORIGIN:
+            _replace_abbr_origin(value)
+        elif full_key == CONF_DEVICE:
+            _replace_abbr_device(value)
+        elif full_key == CONF_AVAILABILITY:
+            if not isinstance(value, list):
+                # Normalize once, so later passes can iterate the list in place
+                value = discovery_payload[CONF_AVAILABILITY] = cv.ensure_list(value)
+            for availability_conf in value:
+                _replace_abbr_root(availability_conf)
 
 
 @callback
 def _replace_topic_base(discovery_payload: dict[str, Any]) -> None:
     """Replace topic base in MQTT discovery data."""
     base = discovery_payload.pop(TOPIC_BASE)
-    for key, value in discovery_payload.items():
-        if isinstance(value, str) and value:
-            if value[0] == TOPIC_BASE and key.endswith("topic"):
-                discovery_payload[key] = f"{base}{value[1:]}"
-            if value[-1] == TOPIC_BASE and key.endswith("topic"):
-                discovery_payload[key] = f"{value[:-1]}{base}"
+    for key in TOPIC_KEYS:
+        value = discovery_payload.get(key)
+        if not value or not isinstance(value, str):
+            continue
+        starts = value.startswith(TOPIC_BASE)
+        ends = value.endswith(TOPIC_BASE)
+        if not (starts or ends):
+            continue
+        if starts:
+            discovery_payload[key] = f"{base}{value[1:]}"
+        if ends:
+            discovery_payload[key] = f"{value[:-1]}{base}"
     if discovery_payload.get(CONF_AVAILABILITY):
-        for availability_conf in cv.ensure_list(discovery_payload[CONF_AVAILABILITY]):
+        # Availability was normalized to a list by _replace_all_abbreviations
+        for availability_conf in discovery_payload[CONF_AVAILABILITY]:
             if not isinstance(availability_conf, dict):
                 continue
             if topic := str(availability_conf.get(CONF_TOPIC)):
@@ -192,24 +260,28 @@ async def async_start(  # noqa: C901
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
     integration_discovery_messages: dict[str, int] = {}
+    discovery_prefix = f"{discovery_topic}/"
+    discovery_prefix_len = len(discovery_prefix)
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
         """Add a component from a discovery message."""
         discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
         component, discovery_id = discovery_hash
-        message = f"Found new component: {component} {discovery_id}"
-        async_log_discovery_origin_info(message, discovery_payload)
-        mqtt_data.discovery_already_discovered.add(discovery_hash)
-        async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
+        async_log_discovery_origin_info(
+            lambda: f"Found new component: {component} {discovery_id}",
+            discovery_payload,
         )
+        mqtt_data.discovery_already_discovered.add(discovery_hash)
+        async_dispatcher_send(hass, DISCOVERY_NEW_SIGNALS[component], discovery_payload)
 
     async def _async_component_setup(
         component: str, discovery_payload: MQTTDiscoveryPayload
     ) -> None:
         """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
+        if (lock := platform_setup_lock.get(component)) is None:
+            lock = platform_setup_lock[component] = asyncio.Lock()
+        async with lock:
             if component not in mqtt_data.platforms_loaded:
                 await async_forward_entry_setup_and_setup_discovery(
                     hass, config_entry, {component}
@@ -219,42 +291,53 @@ async def async_start(  # noqa: C901
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
         """Process the received message."""
-        mqtt_data.last_discovery = msg.timestamp
         payload = msg.payload
         topic = msg.topic
-        topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
-
-        if not (match := TOPIC_MATCHER.match(topic_trimmed)):
-            if topic_trimmed.endswith("config"):
-                _LOGGER.warning(
-                    (
-                        "Received message on illegal discovery topic '%s'. The topic"
-                        " contains "
-                        "not allowed characters. For more information see "
-                        "https://www.home-assistant.io/integrations/mqtt/#discovery-topic"
-                    ),
-                    topic,
-                )
+        topic_trimmed = (
+            topic[discovery_prefix_len:]
+            if topic.startswith(discovery_prefix)
+            else topic
+        )
+        if topic_trimmed.partition("/")[0] not in SUPPORTED_COMPONENTS:
+            return
+
+        if (parsed_topic := _parse_topic(topic_trimmed)) is None:
+            _LOGGER.warning(
+                (
+                    "Received message on illegal discovery topic '%s'. The topic"
+                    " contains "
+                    "not allowed characters. For more information see "
+                    "https://www.home-assistant.io/integrations/mqtt/#discovery-topic"
+                ),
+                topic,
+            )
             return
 
-        component, node_id, object_id = match.groups()
+        component, node_id, object_id = parsed_topic
+        mqtt_data.last_discovery = msg.timestamp
 
-        if payload:
+        if not payload:
+            # An empty payload removes the component, there is nothing to parse
+            discovery_payload = MQTTDiscoveryPayload()
+        else:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
             except ValueError:
                 _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
                 return
             _replace_all_abbreviations(discovery_payload)
-            if not _valid_origin_info(discovery_payload):
+            if CONF_ORIGIN in discovery_payload and not _valid_origin_info(
+                discovery_payload
+            ):
                 return
             if TOPIC_BASE in discovery_payload:
                 _replace_topic_base(discovery_payload)
-        else:
-            discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        # If present, the node_id will be included in the discovered object id.
+        # Interned, as the hash is used repeatedly as key in discovery sets
+        # and dicts for the same components and devices
+        component = sys.intern(component)
+        discovery_id = sys.intern(f"{node_id} {object_id}" if node_id else object_id)
         discovery_hash = (component, discovery_id)
 
         if discovery_payload:
@@ -269,13 +352,16 @@ async def async_start(  # noqa: C901
                 ATTR_DISCOVERY_PAYLOAD: discovery_payload,
                 ATTR_DISCOVERY_TOPIC: topic,
             }
-            setattr(discovery_payload, "discovery_data", discovery_data)
+            discovery_payload.discovery_data = discovery_data
 
             discovery_payload[CONF_PLATFORM] = "mqtt"
 
         if discovery_hash in mqtt_data.discovery_pending_discovered:
-            pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
-            pending.appendleft(discovery_payload)
+            pending_discovered = mqtt_data.discovery_pending_discovered[discovery_hash]
+            if (pending := pending_discovered.pending) is None:
+                pending_discovered.pending = deque((discovery_payload,))
+            else:
+                pending.appendleft(discovery_payload)
             _LOGGER.debug(
                 "Component has already been discovered: %s %s, queuing update",
                 component,
@@ -302,23 +388,22 @@ async def async_start(  # noqa: C901
 
             @callback
             def discovery_done(_: Any) -> None:
-                pending = discovery_pending_discovered[discovery_hash]["pending"]
+                pending = discovery_pending_discovered[discovery_hash].pending
                 _LOGGER.debug("Pending discovery for %s: %s", discovery_hash, pending)
                 if not pending:
-                    discovery_pending_discovered[discovery_hash]["unsub"]()
+                    discovery_pending_discovered[discovery_hash].unsub()
                     discovery_pending_discovered.pop(discovery_hash)
                 else:
                     payload = pending.pop()
                     async_process_discovery_payload(component, discovery_id, payload)
 
-            discovery_pending_discovered[discovery_hash] = {
-                "unsub": async_dispatcher_connect(
+            discovery_pending_discovered[discovery_hash] = PendingDiscovered(
+                async_dispatcher_connect(
                     hass,
-                    MQTT_DISCOVERY_DONE.format(*discovery_hash),
+                    _discovery_done_signal(discovery_hash),
                     discovery_done,
-                ),
-                "pending": deque([]),
-            }
+                )
+            )
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
@@ -327,19 +412,25 @@ async def async_start(  # noqa: C901
             )
         elif already_discovered:
             # Dispatch update
-            message = f"Component has already been discovered: {component} {discovery_id}, sending update"
-            async_log_discovery_origin_info(message, payload, logging.DEBUG)
+            async_log_discovery_origin_info(
+                lambda: (
+                    "Component has already been discovered: "
+                    f"{component} {discovery_id}, sending update"
+                ),
+                payload,
+                logging.DEBUG,
+            )
             async_dispatcher_send(
-                hass, MQTT_DISCOVERY_UPDATED.format(*discovery_hash), payload
+                hass, _discovery_updated_signal(discovery_hash), payload
             )
         elif payload:
             _async_add_component(payload)
         else:
             # Unhandled discovery message
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None
-            )
+            async_dispatcher_send(hass, _discovery_done_signal(discovery_hash), None)
 
+    # Two wildcard subscriptions for all components, with and without node_id,
+    # unsupported components are filtered in the callback
     mqtt_data.discovery_unsubscribe = [
         async_subscribe_internal(
             hass,
@@ -348,15 +439,9 @@ async def async_start(  # noqa: C901
             0,
             job_type=HassJobType.Callback,
         )
-        for topic in chain(
-            (
-                f"{discovery_topic}/{component}/+/config"
-                for component in SUPPORTED_COMPONENTS
-            ),
-            (
-                f"{discovery_topic}/{component}/+/+/config"
-                for component in SUPPORTED_COMPONENTS
-            ),
+        for topic in (
+            f"{discovery_topic}/+/+/config",
+            f"{discovery_topic}/+/+/+/config",
         )
     ]
 
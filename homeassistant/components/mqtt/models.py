@@ -117,11 +117,13 @@ class TriggerDebugInfo(TypedDict):
     discovery_data: DiscoveryInfoType
 
 
-class PendingDiscovered(TypedDict):
+@dataclass(slots=True)
+class PendingDiscovered:
     """Pending discovered items."""
 
-    pending: deque[MQTTDiscoveryPayload]
     unsub: CALLBACK_TYPE
+    # Only allocated when a second payload arrives while pending
+    pending: deque[MQTTDiscoveryPayload] | None = None
 
 
 class MqttOriginInfo(TypedDict, total=False):
@@ -1,9 +1,11 @@
 """Support for Minut Point."""
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from http import HTTPStatus
 import logging
+from typing import Any
 
 from aiohttp import ClientError, ClientResponseError, web
 from pypoint import PointSession
@@ -18,28 +20,42 @@ from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    CONF_SCAN_INTERVAL,
     CONF_WEBHOOK_ID,
     Platform,
 )
-from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    DOMAIN as HOMEASSISTANT_DOMAIN,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import (
     aiohttp_client,
     config_entry_oauth2_flow,
     config_validation as cv,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from . import api
 from .const import (
+    CHANGE_INTERVAL_SMOOTHING,
+    CONF_POLLS_PER_HOUR,
     CONF_WEBHOOK_URL,
     DOMAIN,
     EVENT_RECEIVED,
+    MAX_SCAN_INTERVAL,
+    MIN_CHANGE_SAMPLES,
     POINT_DISCOVERY_NEW,
+    POLLS_PER_HOUR,
     SCAN_INTERVAL,
+    SETUP_TIMEOUT,
     SIGNAL_UPDATE_ENTITY,
     SIGNAL_WEBHOOK,
 )
@@ -48,6 +64,11 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
+_DISCOVERY_SIGNALS = {
+    platform: POINT_DISCOVERY_NEW.format(platform)
+    for platform in (*PLATFORMS, Platform.ALARM_CONTROL_PANEL)
+}
+
 type PointConfigEntry = ConfigEntry[PointData]
 
 CONFIG_SCHEMA = vol.Schema(
@@ -132,17 +153,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: PointConfigEntry) -> boo
     point_session = PointSession(auth)
 
     client = MinutPointClient(hass, entry, point_session)
-    hass.async_create_task(client.update())
     entry.runtime_data = PointData(client)
 
-    await async_setup_webhook(hass, entry, point_session)
+    try:
+        await _async_setup_client(hass, entry, client, point_session)
+    except BaseException:
+        # The task group has already cancelled and awaited the other request
+        client.async_shutdown()
+        if CONF_WEBHOOK_ID in entry.data:
+            webhook.async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
+        raise
+
     await hass.config_entries.async_forward_entry_setups(
         entry, [*PLATFORMS, Platform.ALARM_CONTROL_PANEL]
     )
+    client.async_start()
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_setup_client(
+    hass: HomeAssistant,
+    entry: PointConfigEntry,
+    client: "MinutPointClient",
+    session: PointSession,
+) -> None:
+    """Fetch the devices and register the webhook concurrently."""
+    try:
+        async with asyncio.timeout(SETUP_TIMEOUT), asyncio.TaskGroup() as tg:
+            tg.create_task(client.async_refresh())
+            tg.create_task(async_setup_webhook(hass, entry, session))
+    except* (ClientError, TimeoutError) as err:
+        raise ConfigEntryNotReady from err
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: PointConfigEntry) -> None:
+    """Reload the entry when the options changed."""
+    if entry.options != entry.runtime_data.client.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_setup_webhook(
     hass: HomeAssistant, entry: PointConfigEntry, session: PointSession
 ) -> None:
@@ -176,6 +227,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: PointConfigEntry) -> bo
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, [*PLATFORMS, Platform.ALARM_CONTROL_PANEL]
     ):
+        entry.runtime_data.client.async_shutdown()
         session: PointSession = entry.runtime_data.client
         if CONF_WEBHOOK_ID in entry.data:
             webhook.async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
@@ -208,44 +260,171 @@ class MinutPointClient:
         """Initialize the Minut data object."""
         self._known_devices: set[str] = set()
         self._known_homes: set[str] = set()
+        self._device_ids: frozenset[str] = frozenset()
         self._hass = hass
         self._config_entry = config_entry
         self._is_available = True
         self._client = session
+        # Options the client was built with, token refreshes don't change these
+        self._options = dict(config_entry.options)
+        self._scan_interval = config_entry.options.get(
+            CONF_SCAN_INTERVAL, SCAN_INTERVAL.total_seconds()
+        )
+        self._polls_per_hour = config_entry.options.get(
+            CONF_POLLS_PER_HOUR, POLLS_PER_HOUR
+        )
+        self._cancel_poll: CALLBACK_TYPE | None = None
+        # Last seen update of every device and when the change was observed
+        self._last_changes: dict[str, tuple[str, float]] = {}
+        # Moving average of the seconds between changes of every device
+        self._change_intervals: dict[str, float] = {}
+        self._change_samples = 0
+        # Discovery is held back until the platforms listen for new devices
+        self._platforms_ready = False
+        self._stopped = False
+        # Back to back syncs only write the entity states once
+        self._update_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=True,
+            function=self._async_dispatch_update,
+        )
 
-        async_track_time_interval(self._hass, self.update, SCAN_INTERVAL)
+    @callback
+    def async_start(self) -> None:
+        """Announce the devices found so far and start polling."""
+        self._platforms_ready = True
+        self._async_discover()
+        self._schedule_next_poll()
 
-    async def update(self, *args):
+    async def update(self) -> None:
         """Periodically poll the cloud for current state."""
-        await self._sync()
+        try:
+            await self.async_refresh()
+        finally:
+            # The next poll is only scheduled once this one is done, so slow
+            # responses never pile up polls
+            if not self._stopped:
+                self._schedule_next_poll()
+
+    @callback
+    def _schedule_next_poll(self) -> None:
+        """Schedule the next poll of the cloud."""
+        self.async_cancel_poll()
+        self._cancel_poll = async_call_later(
+            self._hass, self._next_poll_delay(), self._async_poll
+        )
+
+    @callback
+    def _async_poll(self, _now: datetime) -> None:
+        """Poll the cloud from the timer."""
+        self._cancel_poll = None
+        self._config_entry.async_create_background_task(
+            self._hass, self.update(), "point_poll"
+        )
+
+    @callback
+    def async_cancel_poll(self) -> None:
+        """Cancel the scheduled poll."""
+        if self._cancel_poll:
+            self._cancel_poll()
+            self._cancel_poll = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop polling and drop pending entity updates."""
+        self._stopped = True
+        self.async_cancel_poll()
+        self._update_debouncer.async_shutdown()
+
+    @callback
+    def _async_dispatch_update(self) -> None:
+        """Notify the entities about updated devices."""
+        async_dispatcher_send(self._hass, SIGNAL_UPDATE_ENTITY)
+
+    def _next_poll_delay(self) -> float:
+        """Return the seconds until the next poll.
+
+        Devices are polled about twice per observed change interval of the most
+        active device, bounded by the configured scan interval, the poll budget
+        and the maximum scan interval.
+        """
+        if self._change_samples < MIN_CHANGE_SAMPLES or not self._change_intervals:
+            return self._scan_interval
+        delay = min(self._change_intervals.values()) / 2
+        min_delay = max(self._scan_interval, 3600 / self._polls_per_hour)
+        max_delay = max(self._scan_interval, MAX_SCAN_INTERVAL.total_seconds())
+        return min(max(delay, min_delay), max_delay)
+
+    @callback
+    def _record_change(self, device_id: str, last_update: str, now: float) -> None:
+        """Track the interval between changes of a device."""
+        previous = self._last_changes.get(device_id)
+        if previous is not None and previous[0] == last_update:
+            return
+        self._last_changes[device_id] = (last_update, now)
+        if previous is None:
+            return
+        interval = now - previous[1]
+        if (average := self._change_intervals.get(device_id)) is None:
+            self._change_intervals[device_id] = interval
+        else:
+            self._change_intervals[device_id] = average + CHANGE_INTERVAL_SMOOTHING * (
+                interval - average
+            )
+        self._change_samples += 1
+
+    async def async_refresh(self) -> None:
+        """Fetch the devices from the cloud, unless a fetch is in progress."""
+        entry_lock = self._config_entry.runtime_data.entry_lock
+        if entry_lock.locked():
+            # A sync is in progress, skip instead of queuing another request
+            return
+        async with entry_lock:
+            await self._async_sync_devices()
 
-    async def _sync(self):
-        """Update local list of devices."""
+    async def _async_sync_devices(self):
+        """Fetch the devices from the cloud and dispatch updates."""
         if not await self._client.update():
             self._is_available = False
             _LOGGER.warning("Device is unavailable")
-            async_dispatcher_send(self._hass, SIGNAL_UPDATE_ENTITY)
+            self._update_debouncer.async_schedule_call()
             return
 
         self._is_available = True
-        for home_id in self._client.homes:
-            if home_id not in self._known_homes:
-                async_dispatcher_send(
-                    self._hass,
-                    POINT_DISCOVERY_NEW.format(Platform.ALARM_CONTROL_PANEL),
-                    home_id,
-                )
-                self._known_homes.add(home_id)
+        now = dt_util.utcnow().timestamp()
         for device in self._client.devices:
-            if device.device_id not in self._known_devices:
-                for platform in PLATFORMS:
-                    async_dispatcher_send(
-                        self._hass,
-                        POINT_DISCOVERY_NEW.format(platform),
-                        device.device_id,
-                    )
-                self._known_devices.add(device.device_id)
-        async_dispatcher_send(self._hass, SIGNAL_UPDATE_ENTITY)
+            self._record_change(device.device_id, device.last_update, now)
+        if (device_ids := frozenset(self._client.device_ids)) != self._device_ids:
+            # Removed devices must no longer set the poll delay
+            for device_id in self._device_ids - device_ids:
+                self._last_changes.pop(device_id, None)
+                self._change_intervals.pop(device_id, None)
+            self._device_ids = device_ids
+        if self._platforms_ready:
+            self._async_discover()
+        self._update_debouncer.async_schedule_call()
+
+    @callback
+    def _async_discover(self) -> None:
+        """Announce new homes and devices to the platforms."""
+        new_homes = set(self._client.homes) - self._known_homes
+        new_devices = set(self._client.device_ids) - self._known_devices
+        if not new_homes and not new_devices:
+            return
+
+        self._known_homes |= new_homes
+        self._known_devices |= new_devices
+        # The platforms are forwarded once during setup, announce all new homes
+        # and devices in one go per platform
+        signal = _DISCOVERY_SIGNALS[Platform.ALARM_CONTROL_PANEL]
+        for home_id in new_homes:
+            async_dispatcher_send(self._hass, signal, home_id)
+        for platform in PLATFORMS:
+            signal = _DISCOVERY_SIGNALS[platform]
+            for device_id in new_devices:
+                async_dispatcher_send(self._hass, signal, device_id)
 
     def device(self, device_id):
         """Return device representation."""
@@ -261,6 +440,11 @@ class MinutPointClient:
         """Remove the session webhook."""
         return await self._client.remove_webhook()
 
+    @property
+    def options(self) -> dict[str, Any]:
+        """Return the options the client was set up with."""
+        return self._options
+
     @property
     def homes(self):
         """Return known homes."""
@@ -280,4 +464,4 @@ class PointData:
     """Point Data."""
 
     client: MinutPointClient
-    entry_lock: asyncio.Lock = asyncio.Lock()
+    entry_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
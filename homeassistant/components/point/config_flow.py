@@ -1,15 +1,25 @@
 """Config flow for Minut Point."""
 
+from __future__ import annotations
+
 from collections.abc import Mapping
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.webhook import async_generate_id
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigFlowResult
-from homeassistant.const import CONF_TOKEN, CONF_WEBHOOK_ID
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    ConfigEntry,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TOKEN, CONF_WEBHOOK_ID
+from homeassistant.core import callback
 from homeassistant.helpers.config_entry_oauth2_flow import AbstractOAuth2FlowHandler
 
-from .const import DOMAIN
+from .const import CONF_POLLS_PER_HOUR, DOMAIN, POLLS_PER_HOUR, SCAN_INTERVAL
 
 
 class OAuth2FlowHandler(AbstractOAuth2FlowHandler, domain=DOMAIN):
@@ -22,6 +32,12 @@ class OAuth2FlowHandler(AbstractOAuth2FlowHandler, domain=DOMAIN):
         """Return logger."""
         return logging.getLogger(__name__)
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> PointOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return PointOptionsFlowHandler(config_entry)
+
     async def async_step_import(self, data: dict[str, Any]) -> ConfigFlowResult:
         """Handle import from YAML."""
         return await self.async_step_user()
@@ -60,3 +76,35 @@ class OAuth2FlowHandler(AbstractOAuth2FlowHandler, domain=DOMAIN):
         return self.async_update_reload_and_abort(
             reauth_entry, data_updates=data, unique_id=user_id
         )
+
+
+class PointOptionsFlowHandler(OptionsFlow):
+    """Handle Minut Point options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize Minut Point options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the Minut Point options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = {
+            vol.Optional(
+                CONF_SCAN_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_SCAN_INTERVAL, int(SCAN_INTERVAL.total_seconds())
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=30)),
+            vol.Optional(
+                CONF_POLLS_PER_HOUR,
+                default=self.config_entry.options.get(
+                    CONF_POLLS_PER_HOUR, POLLS_PER_HOUR
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+        }
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
@@ -5,7 +5,19 @@ from datetime import timedelta
 DOMAIN = "point"
 
 SCAN_INTERVAL = timedelta(minutes=1)
+MAX_SCAN_INTERVAL = timedelta(minutes=15)
+# Default poll budget, the adaptive poll delay never drops below
+# 3600 / polls per hour
+POLLS_PER_HOUR = 60
+# Number of observed device changes before the poll delay is adapted
+MIN_CHANGE_SAMPLES = 3
+# Smoothing factor of the moving average of the device change intervals
+CHANGE_INTERVAL_SMOOTHING = 0.3
 
+# Seconds the initial refresh and webhook registration may take during setup
+SETUP_TIMEOUT = 10
+
+CONF_POLLS_PER_HOUR = "polls_per_hour"
 CONF_WEBHOOK_URL = "webhook_url"
 CONF_REFRESH_TOKEN = "refresh_token"
 EVENT_RECEIVED = "point_webhook_received"
@@ -17,12 +17,15 @@ class MinutPointEntity(Entity):
     """Base Entity used by the sensors."""
 
     _attr_should_poll = False
+    # Raw last_update of the device and its formatted local time
+    _last_update_cache: tuple[str, str] | None = None
 
     def __init__(self, point_client, device_id, device_class) -> None:
         """Initialize the entity."""
         self._async_unsub_dispatcher_connect = None
         self._client = point_client
         self._id = device_id
+        self._device = point_client.device(device_id)
         self._name = self.device.name
         self._attr_device_class = device_class
         self._updated = utc_from_timestamp(0)
@@ -48,7 +51,7 @@ class MinutPointEntity(Entity):
         """Call when entity is added to hass."""
         _LOGGER.debug("Created device %s", self)
         self._async_unsub_dispatcher_connect = async_dispatcher_connect(
-            self.hass, SIGNAL_UPDATE_ENTITY, self._update_callback
+            self.hass, SIGNAL_UPDATE_ENTITY, self._async_update_device
         )
         await self._update_callback()
 
@@ -57,6 +60,11 @@ class MinutPointEntity(Entity):
         if self._async_unsub_dispatcher_connect:
             self._async_unsub_dispatcher_connect()
 
+    async def _async_update_device(self):
+        """Refresh the device representation and update the sensor."""
+        self._device = self._client.device(self._id)
+        await self._update_callback()
+
     async def _update_callback(self):
         """Update the value of the sensor."""
 
@@ -68,7 +76,8 @@ class MinutPointEntity(Entity):
     @property
     def device(self):
         """Return the representation of the device."""
-        return self._client.device(self.device_id)
+        # Looked up once per update signal instead of on every property read
+        return self._device
 
     @property
     def device_id(self):
@@ -78,11 +87,17 @@ class MinutPointEntity(Entity):
     @property
     def extra_state_attributes(self):
         """Return status of device."""
-        attrs = self.device.device_status
-        attrs["last_heard_from"] = as_local(self.last_update).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
-        return attrs
+        device = self.device
+        raw = device.last_update
+        if self._last_update_cache is None or self._last_update_cache[0] != raw:
+            self._last_update_cache = (
+                raw,
+                as_local(parse_datetime(raw)).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        return {
+            **device.device_status,
+            "last_heard_from": self._last_update_cache[1],
+        }
 
     @property
     def is_updated(self):
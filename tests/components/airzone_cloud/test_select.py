@@ -38,8 +38,17 @@ async def test_airzone_create_selects(hass: HomeAssistant) -> None:
     ]
 
 
-async def test_airzone_select_air_quality_mode(hass: HomeAssistant) -> None:
-    """Test select Air Quality mode."""
+@pytest.mark.parametrize(
+    ("entity_id", "option"),
+    [
+        ("select.dormitorio_air_quality_mode", "off"),
+        ("select.salon_mode", "heat"),
+    ],
+)
+async def test_airzone_select_option(
+    hass: HomeAssistant, entity_id: str, option: str
+) -> None:
+    """Test selecting an option."""
 
     await async_init_integration(hass)
 
@@ -48,7 +57,7 @@ async def test_airzone_select_air_quality_mode(hass: HomeAssistant) -> None:
             SELECT_DOMAIN,
             SERVICE_SELECT_OPTION,
             {
-                ATTR_ENTITY_ID: "select.dormitorio_air_quality_mode",
+                ATTR_ENTITY_ID: entity_id,
                 ATTR_OPTION: "Invalid",
             },
             blocking=True,
@@ -62,45 +71,11 @@ async def test_airzone_select_air_quality_mode(hass: HomeAssistant) -> None:
             SELECT_DOMAIN,
             SERVICE_SELECT_OPTION,
             {
-                ATTR_ENTITY_ID: "select.dormitorio_air_quality_mode",
-                ATTR_OPTION: "off",
+                ATTR_ENTITY_ID: entity_id,
+                ATTR_OPTION: option,
             },
             blocking=True,
         )
 
-    state = hass.states.get("select.dormitorio_air_quality_mode")
-    assert state.state == "off"
-
-
-async def test_airzone_select_mode(hass: HomeAssistant) -> None:
-    """Test select HVAC mode."""
-
-    await async_init_integration(hass)
-
-    with pytest.raises(ServiceValidationError):
-        await hass.services.async_call(
-            SELECT_DOMAIN,
-            SERVICE_SELECT_OPTION,
-            {
-                ATTR_ENTITY_ID: "select.salon_mode",
-                ATTR_OPTION: "Invalid",
-            },
-            blocking=True,
-        )
-
-    with patch(
-        "homeassistant.components.airzone_cloud.AirzoneCloudApi.api_patch_device",
-        return_value=None,
-    ):
-        await hass.services.async_call(
-            SELECT_DOMAIN,
-            SERVICE_SELECT_OPTION,
-            {
-                ATTR_ENTITY_ID: "select.salon_mode",
-                ATTR_OPTION: "heat",
-            },
-            blocking=True,
-        )
-
-    state = hass.states.get("select.salon_mode")
-    assert state.state == "heat"
+    state = hass.states.get(entity_id)
+    assert state.state == option
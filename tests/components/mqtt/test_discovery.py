@@ -16,7 +16,6 @@ from homeassistant.components.mqtt.abbreviations import (
     ABBREVIATIONS,
     DEVICE_ABBREVIATIONS,
 )
-from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.discovery import (
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
@@ -78,9 +77,8 @@ async def test_subscribing_config_topic(
     await async_start(hass, discovery_topic, entry)
 
     topics = [call[1][0] for call in mqtt_mock.async_subscribe.mock_calls]
-    for component in SUPPORTED_COMPONENTS:
-        assert f"{discovery_topic}/{component}/+/config" in topics
-        assert f"{discovery_topic}/{component}/+/+/config" in topics
+    assert f"{discovery_topic}/+/+/config" in topics
+    assert f"{discovery_topic}/+/+/+/config" in topics
 
 
 @pytest.mark.parametrize(
@@ -88,6 +86,8 @@ async def test_subscribing_config_topic(
     [
         ("homeassistant/binary_sensor/bla/not_config", False),
         ("homeassistant/binary_sensor/rörkrökare/config", True),
+        ("homeassistant/binary_sensor/node/rörkrökare/config", True),
+        ("homeassistant/binary_sensor//config", True),
     ],
 )
 async def test_invalid_topic(
@@ -0,0 +1,72 @@
+"""Fixtures for Minut Point tests."""
+
+from collections.abc import Generator
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.components.application_credentials import (
+    ClientCredential,
+    async_import_client_credential,
+)
+from homeassistant.components.point.const import DOMAIN
+from homeassistant.config import async_process_ha_core_config
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry
+
+CLIENT_ID = "1234"
+CLIENT_SECRET = "5678"
+WEBHOOK_ID = "mock-webhook-id"
+
+
+@pytest.fixture
+async def setup_credentials(hass: HomeAssistant) -> None:
+    """Fixture to setup credentials and the external URL for the webhook."""
+    assert await async_setup_component(hass, "application_credentials", {})
+    await async_import_client_credential(
+        hass,
+        DOMAIN,
+        ClientCredential(CLIENT_ID, CLIENT_SECRET),
+    )
+    await async_process_ha_core_config(
+        hass,
+        {"external_url": "https://example.com"},
+    )
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    """Return a Minut Point config entry."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="abcd",
+        data={
+            "auth_implementation": DOMAIN,
+            "token": {
+                "access_token": "mock-access-token",
+                "refresh_token": "mock-refresh-token",
+                "expires_at": time.time() + 3600,
+                "type": "Bearer",
+                "user_id": "abcd",
+            },
+            CONF_WEBHOOK_ID: WEBHOOK_ID,
+        },
+    )
+
+
+@pytest.fixture
+def mock_point() -> Generator[MagicMock]:
+    """Mock the Point session without homes or devices."""
+    session = MagicMock()
+    session.update = AsyncMock(return_value=True)
+    session.update_webhook = AsyncMock()
+    session.remove_webhook = AsyncMock()
+    session.homes = {}
+    session.devices = []
+    session.device_ids = []
+    with patch("homeassistant.components.point.PointSession", return_value=session):
+        yield session
@@ -0,0 +1,247 @@
+"""Tests for the Minut Point integration."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from aiohttp import ClientError
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components import webhook
+from homeassistant.components.point.const import (
+    CONF_POLLS_PER_HOUR,
+    POINT_DISCOVERY_NEW,
+    SCAN_INTERVAL,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_SCAN_INTERVAL, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .conftest import WEBHOOK_ID
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+def _mock_device(device_id: str, last_update: str) -> MagicMock:
+    """Return a mocked Point device."""
+    device = MagicMock()
+    device.device_id = device_id
+    device.last_update = last_update
+    return device
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    options: dict[str, int] | None = None,
+) -> None:
+    """Set up the entry without loading the platforms."""
+    config_entry.add_to_hass(hass)
+    if options:
+        hass.config_entries.async_update_entry(config_entry, options=options)
+    with patch.object(hass.config_entries, "async_forward_entry_setups"):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+
+
+async def _async_tick(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float
+) -> None:
+    """Move time forward and run the polls that are due."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+def _change_every(mock_point: MagicMock, polls: int) -> None:
+    """Let the mocked device change every given number of updates."""
+    device = _mock_device("device", "0")
+    mock_point.devices = [device]
+    mock_point.device_ids = ["device"]
+    updates = 0
+
+    async def _update() -> bool:
+        nonlocal updates
+        device.last_update = str(updates // polls)
+        updates += 1
+        return True
+
+    mock_point.update.side_effect = _update
+
+
+@pytest.mark.usefixtures("setup_credentials")
+@pytest.mark.parametrize(
+    ("options", "change_polls", "delay"),
+    [
+        ({CONF_SCAN_INTERVAL: 30}, 1, 60),
+        ({CONF_SCAN_INTERVAL: 30, CONF_POLLS_PER_HOUR: 40}, 1, 90),
+        ({CONF_SCAN_INTERVAL: 60}, 10, 300),
+        ({CONF_SCAN_INTERVAL: 60}, 31, 900),
+        ({CONF_SCAN_INTERVAL: 1200}, 1, 1200),
+    ],
+)
+async def test_poll_delay(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    mock_point: MagicMock,
+    options: dict[str, int],
+    change_polls: int,
+    delay: int,
+) -> None:
+    """Test the poll delay follows the device changes within its bounds."""
+    scan_interval = options[CONF_SCAN_INTERVAL]
+    _change_every(mock_point, change_polls)
+    await _async_setup_entry(hass, config_entry, options)
+    assert mock_point.update.call_count == 1
+
+    # The scan interval is used until enough device changes are observed
+    for poll in range(1, 3 * change_polls + 1):
+        await _async_tick(hass, freezer, scan_interval - 1)
+        assert mock_point.update.call_count == poll
+        await _async_tick(hass, freezer, 1)
+        assert mock_point.update.call_count == poll + 1
+
+    await _async_tick(hass, freezer, delay - 1)
+    assert mock_point.update.call_count == 3 * change_polls + 1
+    await _async_tick(hass, freezer, 1)
+    assert mock_point.update.call_count == 3 * change_polls + 2
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("setup_credentials")
+async def test_poll_delay_removed_device(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    config_entry: MockConfigEntry,
+    mock_point: MagicMock,
+) -> None:
+    """Test a removed device no longer sets the poll delay."""
+    _change_every(mock_point, 10)
+    await _async_setup_entry(hass, config_entry)
+
+    for _ in range(30):
+        await _async_tick(hass, freezer, SCAN_INTERVAL.total_seconds())
+    assert mock_point.update.call_count == 31
+
+    mock_point.devices = []
+    mock_point.device_ids = []
+    await _async_tick(hass, freezer, 300)
+    assert mock_point.update.call_count == 32
+
+    await _async_tick(hass, freezer, SCAN_INTERVAL.total_seconds())
+    assert mock_point.update.call_count == 33
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("setup_credentials")
+async def test_setup_webhook_error(
+    hass: HomeAssistant, config_entry: MockConfigEntry, mock_point: MagicMock
+) -> None:
+    """Test setup is retried when the webhook can't be registered."""
+    mock_point.update_webhook.side_effect = ClientError
+    config_entry.add_to_hass(hass)
+
+    with patch("homeassistant.components.point.async_call_later") as mock_call_later:
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+    assert WEBHOOK_ID not in hass.data.get(webhook.DOMAIN, {})
+    assert not mock_call_later.called
+
+
+@pytest.mark.usefixtures("setup_credentials")
+async def test_setup_announces_devices_after_forwarding(
+    hass: HomeAssistant, config_entry: MockConfigEntry, mock_point: MagicMock
+) -> None:
+    """Test devices of the initial refresh are announced once platforms listen."""
+    calls: list[str] = []
+
+    async def _update() -> bool:
+        calls.append("refresh")
+        return True
+
+    async def _forward(*args: object) -> None:
+        calls.append("forward")
+
+    @callback
+    def _discovered(device_id: str) -> None:
+        calls.append(device_id)
+
+    mock_point.update.side_effect = _update
+    mock_point.devices = [_mock_device("device", "0")]
+    mock_point.device_ids = ["device"]
+    async_dispatcher_connect(
+        hass, POINT_DISCOVERY_NEW.format(Platform.SENSOR), _discovered
+    )
+    config_entry.add_to_hass(hass)
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", side_effect=_forward
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert calls == ["refresh", "forward", "device"]
+    assert WEBHOOK_ID in hass.data[webhook.DOMAIN]
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("setup_credentials")
+async def test_setup_refresh_timeout(
+    hass: HomeAssistant, config_entry: MockConfigEntry, mock_point: MagicMock
+) -> None:
+    """Test setup is retried when the initial refresh doesn't finish in time."""
+
+    async def _update() -> bool:
+        await asyncio.Event().wait()
+        return True
+
+    mock_point.update.side_effect = _update
+    config_entry.add_to_hass(hass)
+
+    with patch("homeassistant.components.point.SETUP_TIMEOUT", 0):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+    assert WEBHOOK_ID not in hass.data.get(webhook.DOMAIN, {})
+
+
+@pytest.mark.usefixtures("setup_credentials")
+async def test_entry_update_reload(
+    hass: HomeAssistant, config_entry: MockConfigEntry, mock_point: MagicMock
+) -> None:
+    """Test the entry is only reloaded when its options change."""
+    await _async_setup_entry(hass, config_entry)
+
+    with patch.object(hass.config_entries, "async_reload") as mock_reload:
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={
+                **config_entry.data,
+                "token": {**config_entry.data["token"], "access_token": "new"},
+            },
+        )
+        await hass.async_block_till_done()
+        assert not mock_reload.called
+
+        hass.config_entries.async_update_entry(
+            config_entry, options={CONF_SCAN_INTERVAL: 300}
+        )
+        await hass.async_block_till_done()
+        mock_reload.assert_called_once_with(config_entry.entry_id)
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()